@@ -5,6 +5,7 @@ import discord
 from discord.ext import commands
 
 from ..common.config import COMMAND_PREFIX, DISCORD_TOKEN
+from ..common.openai_client import close_llm_client
 from .commands import CustomHelpCommand, WerewolfCommands
 
 logging.basicConfig(
@@ -19,6 +20,16 @@ bot = commands.Bot(
     command_prefix=COMMAND_PREFIX, intents=intents, help_command=CustomHelpCommand()
 )
 
+ERROR_HANDLERS = {
+    commands.CommandNotFound: lambda ctx, error: ctx.send(
+        "❌ Command not found. Use `!help` to see available commands."
+    ),
+    commands.MissingRequiredArgument: lambda ctx, error: ctx.send(
+        f"❌ Missing required argument: {error.param}"
+    ),
+    commands.BadArgument: lambda ctx, error: ctx.send("❌ Invalid argument provided."),
+}
+
 
 @bot.event
 async def on_ready():
@@ -40,22 +51,25 @@ async def on_command_error(ctx, error):
         ctx: The command context.
         error: The error that occurred.
     """
-    if isinstance(error, commands.CommandNotFound):
-        await ctx.send("❌ Command not found. Use `!help` to see available commands.")
-    elif isinstance(error, commands.MissingRequiredArgument):
-        await ctx.send(f"❌ Missing required argument: {error.param}")
-    elif isinstance(error, commands.BadArgument):
-        await ctx.send("❌ Invalid argument provided.")
-    else:
-        logger.error(f"Unhandled error: {error}")
-        await ctx.send("❌ An unexpected error occurred.")
+    # Walk the MRO so subclasses (e.g. MemberNotFound) reach their base handler
+    for error_type in type(error).__mro__:
+        handler = ERROR_HANDLERS.get(error_type)
+        if handler:
+            await handler(ctx, error)
+            return
+
+    logger.error(f"Unhandled error: {error}")
+    await ctx.send("❌ An unexpected error occurred.")
 
 
 async def main():
     """Main function to run the bot."""
     async with bot:
         await bot.add_cog(WerewolfCommands(bot))
-        await bot.start(DISCORD_TOKEN)
+        try:
+            await bot.start(DISCORD_TOKEN)
+        finally:
+            await close_llm_client()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,114 @@
+import asyncio
+from datetime import timedelta
+
 import discord
 from discord.ext import commands
 
 from ..common.game_runner import GameRunner
 
+BULK_DELETE_LIMIT = 100  # Max messages per bulk delete request
+BULK_DELETE_CONCURRENCY = 5  # Discord allows 5 bulk deletes per second per channel
+BULK_DELETE_MAX_AGE = timedelta(days=14)  # Older messages can't be bulk deleted
+
+
+def _build_rules_embed() -> discord.Embed:
+    """Build the game rules embed shown by !rules.
+
+    Returns:
+        discord.Embed: The rules embed.
+    """
+    embed = discord.Embed(
+        title="🐺 One Night Ultimate Werewolf Rules",
+        description="Quick guide for 5 players",
+        color=discord.Color.blue(),
+    )
+
+    embed.add_field(
+        name="📋 Setup",
+        value=(
+            "• 8 cards total: 2 Werewolves, 1 Seer, 1 Robber, "
+            "1 Troublemaker, 3 Villagers\n"
+            "• Each player gets 1 card\n"
+            "• 3 cards remain in the center"
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="🌙 Night Phase",
+        value=(
+            "**Werewolves:** See each other (or check center if alone)\n"
+            "**Seer:** Look at 1 player's card OR 2 center cards\n"
+            "**Robber:** Swap with another player and see new role\n"
+            "**Troublemaker:** Swap 2 other players' cards\n"
+            "**Villagers:** Do nothing"
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="☀️ Day Phase",
+        value=(
+            "• Discuss and deduce who the Werewolves are\n"
+            "• Players can lie, tell truth, or bluff\n"
+            "• Use information from night actions wisely"
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="🗳️ Voting",
+        value=(
+            "• Vote for the suspected Werewolf\n"
+            "• Player with most votes is eliminated\n"
+            "• **Village wins** if a Werewolf is eliminated\n"
+            "• **Werewolves win** if no Werewolf is eliminated"
+        ),
+        inline=False,
+    )
+
+    embed.set_footer(
+        text="For detailed rules: https://www.ultraboardgames.com/one-night-ultimate-werewolf/game-rules.php"
+    )
+
+    return embed
+
+
+def _build_help_embed() -> discord.Embed:
+    """Build the command overview embed shown by !help.
+
+    Returns:
+        discord.Embed: The help embed.
+    """
+    embed = discord.Embed(
+        title="🐺 Werewolf Bot Commands",
+        description="List of available commands:",
+        color=discord.Color.blue(),
+    )
+
+    embed.add_field(name="!help", value="Shows this help message", inline=False)
+
+    embed.add_field(
+        name="!play", value="Start an AI-only game with 5 players", inline=False
+    )
+
+    embed.add_field(name="!rules", value="Display the game rules", inline=False)
+
+    embed.add_field(
+        name="!clear <number> or !clear all",
+        value="Clear messages from the channel (requires permissions)",
+        inline=False,
+    )
+
+    embed.set_footer(text="🤖 Currently supports 5 AI players per game")
+
+    return embed
+
+
+# Static embeds are built once at import and reused for every invocation
+RULES_EMBED = _build_rules_embed()
+HELP_EMBED = _build_help_embed()
+
 
 class WerewolfCommands(commands.Cog):
     """Commands for the Werewolf bot."""
@@ -35,61 +141,7 @@ class WerewolfCommands(commands.Cog):
         Args:
             ctx: The command context.
         """
-        embed = discord.Embed(
-            title="🐺 One Night Ultimate Werewolf Rules",
-            description="Quick guide for 5 players",
-            color=discord.Color.blue(),
-        )
-
-        embed.add_field(
-            name="📋 Setup",
-            value=(
-                "• 8 cards total: 2 Werewolves, 1 Seer, 1 Robber, "
-                "1 Troublemaker, 3 Villagers\n"
-                "• Each player gets 1 card\n"
-                "• 3 cards remain in the center"
-            ),
-            inline=False,
-        )
-
-        embed.add_field(
-            name="🌙 Night Phase",
-            value=(
-                "**Werewolves:** See each other (or check center if alone)\n"
-                "**Seer:** Look at 1 player's card OR 2 center cards\n"
-                "**Robber:** Swap with another player and see new role\n"
-                "**Troublemaker:** Swap 2 other players' cards\n"
-                "**Villagers:** Do nothing"
-            ),
-            inline=False,
-        )
-
-        embed.add_field(
-            name="☀️ Day Phase",
-            value=(
-                "• Discuss and deduce who the Werewolves are\n"
-                "• Players can lie, tell truth, or bluff\n"
-                "• Use information from night actions wisely"
-            ),
-            inline=False,
-        )
-
-        embed.add_field(
-            name="🗳️ Voting",
-            value=(
-                "• Vote for the suspected Werewolf\n"
-                "• Player with most votes is eliminated\n"
-                "• **Village wins** if a Werewolf is eliminated\n"
-                "• **Werewolves win** if no Werewolf is eliminated"
-            ),
-            inline=False,
-        )
-
-        embed.set_footer(
-            text="For detailed rules: https://www.ultraboardgames.com/one-night-ultimate-werewolf/game-rules.php"
-        )
-
-        await ctx.send(embed=embed)
+        await ctx.send(embed=RULES_EMBED)
 
     @commands.command(name="clear")
     @commands.has_permissions(manage_messages=True)
@@ -103,12 +155,7 @@ class WerewolfCommands(commands.Cog):
         if amount.lower() == "all":
             await ctx.send("🧹 Clearing all messages...", delete_after=3)
 
-            deleted_total = 0
-            while True:
-                deleted = await ctx.channel.purge(limit=100)
-                deleted_total += len(deleted)
-                if len(deleted) == 0:
-                    break
+            deleted_total = await self._delete_all_messages(ctx.channel)
 
             await ctx.send(f"✅ Cleared {deleted_total} messages!", delete_after=3)
 
@@ -133,6 +180,42 @@ class WerewolfCommands(commands.Cog):
                     '❌ Invalid input. Use a number or "all"', delete_after=5
                 )
 
+    async def _delete_all_messages(self, channel) -> int:
+        """Delete every message in a channel.
+
+        Messages young enough for bulk deletion are removed in concurrent
+        batches of up to 100; older ones are deleted one by one.
+
+        Args:
+            channel: The channel to clear.
+
+        Returns:
+            int: Number of messages deleted.
+        """
+        messages = [message async for message in channel.history(limit=None)]
+
+        cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+        recent = [m for m in messages if m.created_at > cutoff]
+        old = [m for m in messages if m.created_at <= cutoff]
+
+        semaphore = asyncio.Semaphore(BULK_DELETE_CONCURRENCY)
+
+        async def delete_batch(batch):
+            async with semaphore:
+                await channel.delete_messages(batch)
+
+        await asyncio.gather(
+            *(
+                delete_batch(recent[i : i + BULK_DELETE_LIMIT])
+                for i in range(0, len(recent), BULK_DELETE_LIMIT)
+            )
+        )
+
+        for message in old:
+            await message.delete()
+
+        return len(messages)
+
     @clear_messages.error
     async def clear_error(self, ctx, error):
         """Handle errors for the clear command.
@@ -163,30 +246,8 @@ class CustomHelpCommand(commands.MinimalHelpCommand):
         Args:
             mapping: Command mapping from the bot.
         """
-        embed = discord.Embed(
-            title="🐺 Werewolf Bot Commands",
-            description="List of available commands:",
-            color=discord.Color.blue(),
-        )
-
-        embed.add_field(name="!help", value="Shows this help message", inline=False)
-
-        embed.add_field(
-            name="!play", value="Start an AI-only game with 5 players", inline=False
-        )
-
-        embed.add_field(name="!rules", value="Display the game rules", inline=False)
-
-        embed.add_field(
-            name="!clear <number> or !clear all",
-            value="Clear messages from the channel (requires permissions)",
-            inline=False,
-        )
-
-        embed.set_footer(text="🤖 Currently supports 5 AI players per game")
-
         channel = self.get_destination()
-        await channel.send(embed=embed)
+        await channel.send(embed=HELP_EMBED)
 
 
 def setup(bot):
@@ -14,6 +14,13 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "openai/gpt-4o-mini")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Shared HTTP/2 connection pool for concurrent LLM requests
+LLM_MAX_CONNECTIONS = 32
+LLM_MAX_KEEPALIVE_CONNECTIONS = 16
+LLM_REQUEST_TIMEOUT = 60.0
+# Max in-flight LLM requests, to stay within the provider's rate limits
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+
 LANGFUSE_PUBLIC_KEY = os.getenv("LANGFUSE_PUBLIC_KEY", "")
 LANGFUSE_SECRET_KEY = os.getenv("LANGFUSE_SECRET_KEY", "")
 LANGFUSE_HOST = os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
@@ -21,7 +28,7 @@ LANGFUSE_HOST = os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
 GAME_CONFIG = {
     "total_players": 5,
     "total_cards": 8,
-    "roles": [
+    "roles": (
         "Werewolf",
         "Werewolf",
         "Seer",
@@ -30,8 +37,13 @@ GAME_CONFIG = {
         "Villager",
         "Villager",
         "Villager",
-    ],
+    ),
     "conversation_rounds": 3,
+    # Generate each round's statements concurrently; players then only react
+    # to earlier rounds, not to earlier speakers in the same round.
+    "parallel_discussion": False,
+    # Tie-breaking votes before a tied player is eliminated at random
+    "max_tie_rounds": 3,
     "ai_temperature": {"conversation": 0.8, "voting": 0.2},
 }
 
@@ -1,11 +1,35 @@
-import json
+import asyncio
+import os
 import random
-from typing import Dict, List
+from typing import Dict, List, Optional, TextIO, Tuple
+
+import discord
+import openai
+import orjson
 
 from ..conversation.conversation_manager import ConversationManager
 from ..players.roles import create_player
 from .config import GAME_CONFIG, LOG_PATHS
 
+# Fixed announcements for the game phases
+MSG_GAME_START = "🎮 **Game Starting!**\n"
+MSG_ROLES_ASSIGNED = "✅ **Roles have been assigned!**\n"
+MSG_NIGHT_START = "🌙 **Night Phase**\nEveryone close your eyes...\n"
+MSG_DAWN = "☀️ **Dawn breaks! Everyone wake up!**\n"
+MSG_DAY_START = "💬 **Day Phase - Discussion Time!**\n"
+MSG_DISCUSSION_END = "\n**Discussion phase ended!**\n"
+MSG_VOTING_START = (
+    "🗳️ **Voting Phase**\nTime to vote for who you think is a Werewolf!\n"
+)
+MSG_TIE_UNRESOLVED = (
+    "⚖️ **Still tied after {rounds} tie-breaking votes!**\n"
+    "Eliminating one of the tied players at random.\n"
+)
+MSG_GAME_OVER = "\n🎮 **Game Over!**\nThanks for playing!"
+
+# Plain-text logs kept open and buffered for the whole game
+TEXT_LOGS = ("voting_results",)
+
 
 class Game:
     """Main game controller for One Night Ultimate Werewolf.
@@ -25,7 +49,11 @@ class Game:
         self.ctx = ctx
         self.players: List = []
         self.center_roles: List[str] = []
-        self.conversation_manager = ConversationManager()
+        self.night_actions: Dict[str, str] = {}
+        self._player_by_id: Dict = {}
+        self._others_by_id: Dict[str, Tuple] = {}
+        self._log_files: Dict[str, TextIO] = {}
+        self.conversation_manager = ConversationManager(self.night_actions)
         self.phase = "setup"
 
     async def start(self):
@@ -34,65 +62,105 @@ class Game:
         Executes the complete game flow: role assignment, night phase,
         day phase, voting phase, and game end.
         """
-        await self.ctx.send("🎮 **Game Starting!**\n")
+        await self.ctx.send(MSG_GAME_START)
 
-        self._initialize_logs()
+        await self._initialize_logs()
 
-        await self._assign_roles()
-        await self._night_phase()
-        await self._day_phase()
-        await self._voting_phase()
-        await self._end_game()
+        try:
+            await self._assign_roles()
+            await self._night_phase()
+            await self._day_phase()
+            await self._voting_phase()
+            await self._end_game()
+        finally:
+            await self._close_logs()
 
-    def _initialize_logs(self):
+    async def _initialize_logs(self):
         """Initialize all log files for a new game.
 
         Creates or clears all game log files including night actions,
-        day conversation, voting results, and game recap files.
+        day conversation, voting results, and game recap files. The file
+        operations run in a worker thread to keep the event loop responsive.
         """
-        with open(LOG_PATHS["night_actions"], "w") as f:
-            json.dump({}, f)
+        await asyncio.to_thread(self._open_logs)
 
-        with open(LOG_PATHS["day_conversation"], "w") as f:
-            json.dump([], f)
+        self.conversation_manager.clear_history()
 
-        with open(LOG_PATHS["voting_results"], "w") as f:
-            f.write("=== One Night Ultimate Werewolf - Voting Results ===\n\n")
+    def _open_logs(self):
+        """Reset the logs and open the text logs for buffered writing.
+
+        The text logs stay open until _close_logs, so writes during the
+        game only fill the file buffer.
+        """
+        with open(LOG_PATHS["night_actions"], "wb") as f:
+            f.write(orjson.dumps({}))
+
+        with open(LOG_PATHS["day_conversation"], "wb") as f:
+            f.write(orjson.dumps([]))
 
         with open(LOG_PATHS["game_recap"], "w") as f:
             f.write("")
 
-        self.conversation_manager.clear_history()
+        self._log_files = {name: open(LOG_PATHS[name], "w") for name in TEXT_LOGS}
+        self._log_files["voting_results"].write(
+            "=== One Night Ultimate Werewolf - Voting Results ===\n\n"
+        )
+
+    async def _close_logs(self):
+        """Flush and close the text logs opened by _initialize_logs."""
+        log_files = list(self._log_files.values())
+        self._log_files = {}
+
+        def close_all():
+            for log_file in log_files:
+                log_file.close()
+
+        await asyncio.to_thread(close_all)
 
     async def _assign_roles(self):
         """Create players and randomly assign roles.
 
-        Shuffles available roles and assigns them to players, with
+        Deals a shuffled deck of roles to the players, with the
         remaining roles placed in the center pile.
         """
         self.phase = "role_assignment"
 
-        all_roles = GAME_CONFIG["roles"].copy()
-        random.shuffle(all_roles)
+        deck = random.sample(GAME_CONFIG["roles"], k=len(GAME_CONFIG["roles"]))
 
-        self.players = []
-        for player_name in self.player_names:
-            role = all_roles.pop()
-            player = create_player(role, player_name, self)
-            self.players.append(player)
+        self.players = [
+            create_player(role, player_name, self)
+            for player_name, role in zip(self.player_names, deck)
+        ]
 
-        self.center_roles = all_roles
+        self._player_by_id = {p.player_id: p for p in self.players}
+        self._others_by_id = {
+            p.player_id: tuple(q for q in self.players if q is not p)
+            for p in self.players
+        }
+        self.center_roles = deck[len(self.player_names) :]
 
-        await self.ctx.send("✅ **Roles have been assigned!**\n")
+        await self.ctx.send(MSG_ROLES_ASSIGNED)
+
+    def get_other_players(self, player) -> Tuple:
+        """Get every player except the given one.
+
+        Args:
+            player: The player to exclude.
+
+        Returns:
+            Tuple: The other players, in seating order.
+        """
+        return self._others_by_id[player.player_id]
 
     async def _night_phase(self):
         """Execute night phase actions.
 
         Processes night actions for all roles in the correct order:
-        Werewolf, Seer, Robber, Troublemaker, then Villagers.
+        Werewolf, Seer, Robber, Troublemaker. Villagers have no night action
+        and are skipped; their role prompt already tells them so.
         """
         self.phase = "night"
-        await self.ctx.send("🌙 **Night Phase**\nEveryone close your eyes...\n")
+        await self.ctx.send(MSG_NIGHT_START)
 
         role_order = ["Werewolf", "Seer", "Robber", "Troublemaker"]
 
@@ -101,22 +169,40 @@ class Game:
             for player in role_players:
                 await player.perform_night_action()
 
-        villagers = [p for p in self.players if p.assigned_role == "Villager"]
-        for villager in villagers:
-            await villager.perform_night_action()
+        await self.flush_night_actions()
 
-        self.conversation_manager._load_night_actions()
+        await self.ctx.send(MSG_DAWN)
 
-        await self.ctx.send("☀️ **Dawn breaks! Everyone wake up!**\n")
+    async def flush_night_actions(self):
+        """Write all recorded night actions to the log in one go.
+
+        The file is replaced atomically so readers never see a partial log.
+        """
+        await asyncio.to_thread(self._write_night_actions, dict(self.night_actions))
+
+    def _write_night_actions(self, night_actions: Dict[str, str]):
+        """Atomically replace the night actions log.
+
+        Args:
+            night_actions (Dict[str, str]): Mapping of player IDs to actions.
+        """
+        path = LOG_PATHS["night_actions"]
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(night_actions, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
 
     async def _day_phase(self):
         """Execute day phase discussions.
 
         Manages multiple rounds of player discussions where each player
         participates in conversation to gather information and form suspicions.
+        By default each statement is posted to Discord while the next
+        speaker's is generated. With parallel discussion enabled, all statements
+        of a round are generated concurrently and then shared in speaking order.
         """
         self.phase = "day"
-        await self.ctx.send("💬 **Day Phase - Discussion Time!**\n")
+        await self.ctx.send(MSG_DAY_START)
 
         total_rounds = GAME_CONFIG["conversation_rounds"]
 
@@ -126,78 +212,169 @@ class Game:
             round_players = self.players.copy()
             random.shuffle(round_players)
 
+            if GAME_CONFIG["parallel_discussion"]:
+                # Everyone speaks from the previous rounds' transcript only;
+                # statements are then shared in position order.
+                responses = await asyncio.gather(
+                    *(
+                        player.participate_in_conversation(
+                            self.conversation_manager, round_num, total_rounds, position
+                        )
+                        for position, player in enumerate(round_players, 1)
+                    )
+                )
+                for player, response in zip(round_players, responses):
+                    self.conversation_manager.add_to_history(player.player_id, response)
+                    await player.post_statement(self.conversation_manager, response)
+            else:
+                await self._run_sequential_round(round_players, round_num, total_rounds)
+
+            await self.conversation_manager.flush_history()
+
+        await self.ctx.send(MSG_DISCUSSION_END)
+
+    async def _run_sequential_round(
+        self, round_players: List, round_num: int, total_rounds: int
+    ):
+        """Run one discussion round with players speaking in turn.
+
+        Each statement is posted to Discord while the next speaker's is
+        generated. If either fails, the other is cancelled and the error
+        is raised.
+
+        Args:
+            round_players (List): Players in speaking order.
+            round_num (int): Current round number.
+            total_rounds (int): Total number of rounds.
+        """
+        generation = None
+        pending_post = None
+        try:
             for position, player in enumerate(round_players, 1):
-                await player.participate_in_conversation(
-                    self.conversation_manager, round_num, total_rounds, position
+                generation = asyncio.create_task(
+                    player.participate_in_conversation(
+                        self.conversation_manager, round_num, total_rounds, position
+                    )
+                )
+
+                # A failed post aborts the round without waiting on the LLM call
+                if pending_post:
+                    await asyncio.wait(
+                        {generation, pending_post},
+                        return_when=asyncio.FIRST_EXCEPTION,
+                    )
+                    await pending_post
+
+                response = await generation
+                self.conversation_manager.add_to_history(player.player_id, response)
+                pending_post = asyncio.create_task(
+                    player.post_statement(self.conversation_manager, response)
                 )
 
-        await self.ctx.send("\n**Discussion phase ended!**\n")
+            if pending_post:
+                await pending_post
+        finally:
+            tasks = [task for task in (generation, pending_post) if task]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _voting_phase(self):
         """Execute voting phase.
 
         Collects votes from all players and handles tie-breaking votes
-        until a single player is eliminated.
+        until a single player is eliminated. If the tie persists after
+        max_tie_rounds tie-breaking votes, one tied player is eliminated at
+        random.
         """
         self.phase = "voting"
-        await self.ctx.send(
-            "🗳️ **Voting Phase**\nTime to vote for who you think is a Werewolf!\n"
-        )
+        await self.ctx.send(MSG_VOTING_START)
 
         vote_count = await self._collect_votes()
+        _, tied_players = self._get_max_voted(vote_count)
+
+        max_tie_rounds = GAME_CONFIG["max_tie_rounds"]
+        for _ in range(max_tie_rounds):
+            if len(tied_players) <= 1:
+                break
+            await self._handle_tie_vote(vote_count, tied_players)
+            vote_count = await self._collect_votes(vote_count, tied_players)
+            _, tied_players = self._get_max_voted(vote_count)
+
+        if len(tied_players) > 1:
+            await self.ctx.send(MSG_TIE_UNRESOLVED.format(rounds=max_tie_rounds))
+            eliminated_player = random.choice(tied_players)
+        else:
+            eliminated_player = tied_players[0]
 
-        while len(self._get_max_voted_players(vote_count)) > 1:
-            await self._handle_tie_vote(vote_count)
-            vote_count = await self._collect_votes(is_tie_breaker=True)
+        await self._announce_results(vote_count, eliminated_player)
 
-        await self._announce_results(vote_count)
+    async def _collect_votes(
+        self,
+        previous_vote_count: Optional[Dict] = None,
+        tied_players: Optional[List] = None,
+    ) -> Dict:
+        """Collect votes from all players concurrently.
 
-    async def _collect_votes(self, is_tie_breaker: bool = False) -> Dict:
-        """Collect votes from all players.
+        A ballot that fails with an API error counts as an invalid vote.
 
         Args:
-            is_tie_breaker (bool, optional): Whether this is a tie-breaking vote.
-                Defaults to False.
+            previous_vote_count (Optional[Dict], optional): Vote counts of the
+                previous round. When given, this is a tie-breaking vote.
+                Defaults to None.
+            tied_players (Optional[List], optional): Players tied for the most
+                votes in the previous round. Defaults to None.
 
         Returns:
             Dict: Dictionary mapping player objects to their vote counts.
-        """
-        vote_count = {player: 0 for player in self.players}
-        player_dict = {p.player_id: p for p in self.players}
-
-        for player in self.players:
-            if is_tie_breaker:
-                tied_players = [
-                    p.player_id for p in self._get_max_voted_players(vote_count)
-                ]
-                vote_results = self._format_vote_results(vote_count)
-                vote = await player.cast_tie_vote(
-                    self.conversation_manager, tied_players, vote_results
-                )
-            else:
-                vote = await player.cast_vote(self.conversation_manager)
 
-            if vote in player_dict:
-                vote_count[player_dict[vote]] += 1
+        Raises:
+            Exception: If a ballot fails with anything other than an API
+                error, or if every ballot fails.
+        """
+        vote_count = dict.fromkeys(self.players, 0)
+
+        if previous_vote_count is not None:
+            tied_ids = [p.player_id for p in tied_players]
+            vote_results = self._format_vote_results(previous_vote_count)
+            ballots = [
+                player.cast_tie_vote(self.conversation_manager, tied_ids, vote_results)
+                for player in self.players
+            ]
+        else:
+            ballots = [
+                player.cast_vote(self.conversation_manager) for player in self.players
+            ]
+
+        votes = await asyncio.gather(*ballots, return_exceptions=True)
+
+        errors = [vote for vote in votes if isinstance(vote, BaseException)]
+        for error in errors:
+            if not isinstance(error, openai.APIError):
+                raise error
+        if errors and len(errors) == len(votes):
+            raise errors[0]
+
+        for player, vote in zip(self.players, votes):
+            if not isinstance(vote, BaseException) and vote in self._player_by_id:
+                vote_count[self._player_by_id[vote]] += 1
             else:
                 await self.ctx.send(f"⚠️ Invalid vote from {player.player_id}: {vote}")
 
         return vote_count
 
-    def _get_max_voted_players(self, vote_count: Dict) -> List:
-        """Get players with the most votes.
+    def _get_max_voted(self, vote_count: Dict) -> Tuple[int, List]:
+        """Get the highest vote count and the players who received it.
 
         Args:
             vote_count (Dict): Dictionary mapping players to their vote counts.
 
         Returns:
-            List: List of player objects who received the maximum number of votes.
+            Tuple[int, List]: The maximum number of votes and the list of
+                player objects who received it.
         """
-        if not vote_count:
-            return []
-
-        max_votes = max(vote_count.values())
-        return [player for player, votes in vote_count.items() if votes == max_votes]
+        max_votes = max(vote_count.values(), default=0)
+        return max_votes, [p for p, votes in vote_count.items() if votes == max_votes]
 
     def _format_vote_results(self, vote_count: Dict) -> str:
         """Format vote results as a string.
@@ -213,25 +390,33 @@ class Game:
             results.append(f"{player.player_id}: {votes} vote(s)")
         return ", ".join(results)
 
-    async def _handle_tie_vote(self, vote_count: Dict):
+    async def _handle_tie_vote(self, vote_count: Dict, tied_players: List):
         """Handle a tie in voting.
 
         Announces the tie and prepares for a tie-breaking vote round.
 
         Args:
             vote_count (Dict): Dictionary mapping players to their vote counts.
+            tied_players (List): Players tied for the most votes.
         """
-        tied_players = self._get_max_voted_players(vote_count)
-        await self.ctx.send("\n⚖️ **It's a tie!**")
+        tied_names = [p.player_id for p in tied_players]
 
+        embed = discord.Embed(
+            title="⚖️ It's a tie!",
+            description=(
+                f"**Tied players:** {', '.join(tied_names)}\n"
+                "**Additional voting round required!**"
+            ),
+            color=discord.Color.gold(),
+        )
         for player in self.players:
-            await self.ctx.send(f"{player.player_id}: {vote_count[player]} vote(s)")
+            embed.add_field(
+                name=player.player_id, value=f"{vote_count[player]} vote(s)"
+            )
 
-        tied_names = [p.player_id for p in tied_players]
-        await self.ctx.send(f"\n**Tied players:** {', '.join(tied_names)}")
-        await self.ctx.send("**Additional voting round required!**\n")
+        await self.ctx.send(embed=embed)
 
-    async def _announce_results(self, vote_count: Dict):
+    async def _announce_results(self, vote_count: Dict, eliminated_player):
         """Announce game results.
 
         Displays final vote counts, determines the winner, and logs
@@ -239,36 +424,45 @@ class Game:
 
         Args:
             vote_count (Dict): Dictionary mapping players to their vote counts.
+            eliminated_player: The player object with the most votes.
         """
-        await self.ctx.send("\n🏁 **Final Results**\n")
-
-        with open(LOG_PATHS["voting_results"], "a") as f:
-            f.write("Final Vote Count:\n")
-
-            for player in self.players:
-                votes = vote_count[player]
-                result_line = (
-                    f"{player.player_id} "
-                    f"(Started as: {player.assigned_role}, "
-                    f"Ended as: {player.current_role}): "
-                    f"{votes} vote(s)"
-                )
-
-                await self.ctx.send(result_line)
-                f.write(result_line + "\n")
-
-        eliminated_player = max(vote_count, key=vote_count.get)
         winner = self._determine_winner(eliminated_player)
 
         if winner == "Village":
-            await self.ctx.send("\n🏆 **Village Team Wins!** 🎉")
+            banner = "🏆 **Village Team Wins!** 🎉"
+            color = discord.Color.green()
             result_text = "Game Result: Village Team Victory!"
         else:
-            await self.ctx.send("\n🐺 **Werewolf Team Wins!** 🎉")
+            banner = "🐺 **Werewolf Team Wins!** 🎉"
+            color = discord.Color.red()
             result_text = "Game Result: Werewolf Team Victory!"
 
-        with open(LOG_PATHS["voting_results"], "a") as f:
-            f.write(f"\n{result_text}\n")
+        embed = discord.Embed(title="🏁 Final Results", description=banner, color=color)
+        result_lines = []
+
+        for player in self.players:
+            votes = vote_count[player]
+            embed.add_field(
+                name=player.player_id,
+                value=(
+                    f"{votes} vote(s)\n"
+                    f"Started as: {player.assigned_role}\n"
+                    f"Ended as: {player.current_role}"
+                ),
+            )
+            result_lines.append(
+                f"{player.player_id} "
+                f"(Started as: {player.assigned_role}, "
+                f"Ended as: {player.current_role}): "
+                f"{votes} vote(s)"
+            )
+
+        await self.ctx.send(embed=embed)
+
+        vote_log = "\n".join(result_lines)
+        self._log_files["voting_results"].write(
+            f"Final Vote Count:\n{vote_log}\n\n{result_text}\n"
+        )
 
     def _determine_winner(self, eliminated_player) -> str:
         """Determine which team won.
@@ -290,4 +484,4 @@ class Game:
         Sets the game phase to ended and sends a final game over message.
         """
         self.phase = "ended"
-        await self.ctx.send("\n🎮 **Game Over!**\nThanks for playing!")
+        await self.ctx.send(MSG_GAME_OVER)
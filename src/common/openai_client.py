@@ -1,10 +1,35 @@
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Optional
 
+import httpx
 from langfuse.openai import openai
 
-from .config import DEFAULT_MODEL, OPENAI_API_KEY, OPENROUTER_BASE_URL
+from .config import (
+    DEFAULT_MODEL,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_CONNECTIONS,
+    LLM_MAX_KEEPALIVE_CONNECTIONS,
+    LLM_REQUEST_TIMEOUT,
+    OPENAI_API_KEY,
+    OPENROUTER_BASE_URL,
+)
+
+
+@lru_cache(maxsize=1)
+def _load_config_json() -> Optional[Dict]:
+    """Load config.json once per process.
+
+    Returns:
+        Optional[Dict]: The parsed config file, or None if it does not exist.
+    """
+    try:
+        with open("config.json") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
 
 
 class LLMClient:
@@ -18,14 +43,29 @@ class LLMClient:
         """Initialize the LLM client with API configuration and Langfuse setup."""
         self.api_key = self._get_api_key()
         self.default_model = DEFAULT_MODEL
+        self._semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
 
         self._setup_langfuse()
 
-        self.client = openai.OpenAI(
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=LLM_REQUEST_TIMEOUT,
+        )
+
+        self.client = openai.AsyncOpenAI(
             base_url=OPENROUTER_BASE_URL,
             api_key=self.api_key,
+            http_client=self._http_client,
         )
 
+    async def close(self):
+        """Close the underlying HTTP connection pool."""
+        await self._http_client.aclose()
+
     def _setup_langfuse(self):
         """Setup Langfuse configuration from environment or config file.
 
@@ -34,18 +74,17 @@ class LLMClient:
         are not found.
         """
         if not os.getenv("LANGFUSE_PUBLIC_KEY") or not os.getenv("LANGFUSE_SECRET_KEY"):
-            try:
-                with open("config.json") as f:
-                    config = json.load(f)
-
-                if "langfuse_public_key" in config:
-                    os.environ["LANGFUSE_PUBLIC_KEY"] = config["langfuse_public_key"]
-                if "langfuse_secret_key" in config:
-                    os.environ["LANGFUSE_SECRET_KEY"] = config["langfuse_secret_key"]
-                if "langfuse_host" in config:
-                    os.environ["LANGFUSE_HOST"] = config["langfuse_host"]
-            except (FileNotFoundError, KeyError):
+            config = _load_config_json()
+            if config is None:
                 print("Warning: Langfuse keys not found. Tracing disabled.")
+                return
+
+            if "langfuse_public_key" in config:
+                os.environ["LANGFUSE_PUBLIC_KEY"] = config["langfuse_public_key"]
+            if "langfuse_secret_key" in config:
+                os.environ["LANGFUSE_SECRET_KEY"] = config["langfuse_secret_key"]
+            if "langfuse_host" in config:
+                os.environ["LANGFUSE_HOST"] = config["langfuse_host"]
 
     def _get_api_key(self) -> str:
         """Get API key from environment or config file.
@@ -59,19 +98,15 @@ class LLMClient:
         api_key = OPENAI_API_KEY
 
         if not api_key:
-            try:
-                with open("config.json") as f:
-                    config = json.load(f)
-                api_key = config.get("openai_api_key")
-            except FileNotFoundError:
-                pass
+            config = _load_config_json() or {}
+            api_key = config.get("openai_api_key")
 
         if not api_key:
             raise ValueError("OpenAI API key not found in environment or config.json")
 
         return api_key
 
-    def create_completion(
+    async def create_completion(
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
@@ -81,6 +116,8 @@ class LLMClient:
     ) -> str:
         """Create a chat completion and return the response content.
 
+        At most LLM_MAX_CONCURRENCY requests are in flight at once.
+
         Args:
             messages (List[Dict[str, str]]): List of message dictionaries with
                 'role' and 'content' keys.
@@ -105,10 +142,85 @@ class LLMClient:
             if trace_name:
                 kwargs["name"] = trace_name
 
-            response = self.client.chat.completions.create(
-                model=model, messages=messages, temperature=temperature, **kwargs
-            )
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model=model, messages=messages, temperature=temperature, **kwargs
+                )
             return response.choices[0].message.content
         except Exception as e:
             print(f"Error creating completion: {e}")
             raise
+
+    async def stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        model: Optional[str] = None,
+        trace_name: Optional[str] = None,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding content deltas as they arrive.
+
+        The concurrency slot is held until the stream is exhausted.
+
+        Args:
+            messages (List[Dict[str, str]]): List of message dictionaries with
+                'role' and 'content' keys.
+            temperature (float, optional): Sampling temperature between 0 and 1.
+                Defaults to 0.7.
+            model (Optional[str], optional): Model to use for completion.
+                Defaults to DEFAULT_MODEL if None.
+            trace_name (Optional[str], optional): Name for Langfuse trace tracking.
+                Defaults to None.
+            **kwargs: Additional parameters passed to the OpenAI API.
+
+        Yields:
+            str: The next piece of response content from the LLM.
+
+        Raises:
+            Exception: If the API call fails or returns an error.
+        """
+        if model is None:
+            model = self.default_model
+
+        if trace_name:
+            kwargs["name"] = trace_name
+
+        async with self._semaphore:
+            try:
+                stream = await self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    stream=True,
+                    **kwargs,
+                )
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                print(f"Error streaming completion: {e}")
+                raise
+
+
+_llm_client: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """Get the process-wide LLM client, creating it on first use.
+
+    Returns:
+        LLMClient: The shared LLM client.
+    """
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClient()
+    return _llm_client
+
+
+async def close_llm_client():
+    """Close the process-wide LLM client if it was created."""
+    global _llm_client
+    if _llm_client is not None:
+        await _llm_client.close()
+        _llm_client = None
@@ -1,10 +1,42 @@
-import json
+import asyncio
 import re
-from typing import Dict, List, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 from ..common.config import GAME_CONFIG, LOG_PATHS, PLAYER_COLORS
-from ..common.openai_client import LLMClient
-from .prompt_manager import PromptManager
+from ..common.openai_client import get_llm_client
+from .prompt_manager import get_prompt_manager
+
+# Longest IDs first so e.g. "AI_P10" is not matched as "AI_P1"
+_MENTION_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(PLAYER_COLORS, key=len, reverse=True)))
+)
+_VOTE_STRIP_TABLE = str.maketrans("", "", "'\".")
+
+
+def _colorize_mention(match: re.Match) -> str:
+    """Wrap a matched player mention in the player's ANSI color."""
+    player_id = match.group(0)
+    return f"\u001b[{PLAYER_COLORS.get(player_id, 37)}m{player_id}\u001b[0m"
+
+
+@lru_cache(maxsize=None)
+def _clean_pattern(player_id: str) -> re.Pattern:
+    """Get the regex matching echoed player IDs at the start of a response.
+
+    Matches "<player_id>: " optionally followed by one more "<any_id>: ".
+
+    Args:
+        player_id (str): The player's ID.
+
+    Returns:
+        re.Pattern: The compiled, start-anchored pattern.
+    """
+    return re.compile(
+        rf"^{re.escape(player_id)}: (?:(?:{_MENTION_PATTERN.pattern}): )?"
+    )
 
 
 class ConversationManager:
@@ -14,44 +46,60 @@ class ConversationManager:
     voting, and response formatting for the game.
     """
 
-    def __init__(self):
-        """Initialize the conversation manager with LLM client and prompt manager."""
-        self.llm_client = LLMClient()
-        self.prompt_manager = PromptManager()
-        self.conversation_history: List[Dict[str, str]] = []
-        self.night_actions: Dict[str, str] = {}
-        self._load_night_actions()
+    def __init__(self, night_actions: Optional[Dict[str, str]] = None):
+        """Initialize the conversation manager with LLM client and prompt manager.
 
-    def _load_night_actions(self):
-        """Load night actions from file.
+        The LLM client and prompt manager are shared by all games in the process.
 
-        Attempts to load night actions from the configured log file,
-        initializing to empty dict if file not found or invalid.
+        Args:
+            night_actions (Optional[Dict[str, str]], optional): The game's
+                mapping of player IDs to night actions. It is read live, so
+                actions recorded later are seen. Defaults to None.
         """
-        try:
-            with open(LOG_PATHS["night_actions"], "r") as f:
-                self.night_actions = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.night_actions = {}
+        self.llm_client = get_llm_client()
+        self.prompt_manager = get_prompt_manager()
+        self.conversation_history: List[Dict[str, str]] = []
+        self.night_actions: Dict[str, str] = (
+            night_actions if night_actions is not None else {}
+        )
+        self._system_messages: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+        self._transcript_lines: List[str] = []
+        self._transcript_message: Optional[Dict[str, str]] = None
+        self._transcript_length = 0
 
     def add_to_history(self, player_id: str, content: str):
         """Add a message to conversation history.
 
+        The history is only written to file by flush_history.
+
         Args:
             player_id (str): The ID of the player making the statement.
             content (str): The content of the message.
         """
         self.conversation_history.append({"player_id": player_id, "content": content})
-        self._save_conversation_history()
+        self._transcript_lines.append(f"{player_id}: {content}")
 
-    def _save_conversation_history(self):
+    async def flush_history(self):
+        """Save a snapshot of the conversation history to file.
+
+        Called at round boundaries instead of after every message; the
+        write runs in a worker thread.
+        """
+        await asyncio.to_thread(
+            self._save_conversation_history, list(self.conversation_history)
+        )
+
+    def _save_conversation_history(self, history: List[Dict[str, str]]):
         """Save conversation history to file.
 
-        Writes the current conversation history to the configured log file
+        Writes the given conversation history to the configured log file
         in JSON format.
+
+        Args:
+            history (List[Dict[str, str]]): The conversation history to save.
         """
-        with open(LOG_PATHS["day_conversation"], "w") as f:
-            json.dump(self.conversation_history, f, indent=2)
+        with open(LOG_PATHS["day_conversation"], "wb") as f:
+            f.write(orjson.dumps(history, option=orjson.OPT_INDENT_2))
 
     def build_context_messages(
         self, player, is_day_phase: bool = True
@@ -66,36 +114,69 @@ class ConversationManager:
         Returns:
             List[Dict[str, str]]: List of message dictionaries for the LLM.
         """
-        messages = []
+        night_action = self.night_actions.get(player.player_id, "")
+        messages = [
+            self._get_system_message(
+                player.player_id, player.assigned_role, night_action
+            )
+        ]
 
-        game_context = self.prompt_manager.format_game_context(player.player_id)
-        messages.append({"role": "system", "content": game_context})
+        transcript_message = self._get_transcript_message()
+        if transcript_message:
+            messages.append(transcript_message)
 
-        role_prompt = self.prompt_manager.get_role_prompt(player.assigned_role)
-        messages.append({"role": "system", "content": role_prompt})
+        return messages
 
-        night_action = self.night_actions.get(player.player_id, "")
-        if night_action:
-            messages.append(
-                {"role": "system", "content": f"Your night action: {night_action}"}
+    def _get_system_message(
+        self, player_id: str, role: str, night_action: str
+    ) -> Dict[str, str]:
+        """Get the system message for a player, building it on first use.
+
+        Args:
+            player_id (str): The player's ID.
+            role (str): The player's assigned role.
+            night_action (str): The player's night action, or empty string.
+
+        Returns:
+            Dict[str, str]: The cached system message. Callers must not
+                mutate it.
+        """
+        key = (player_id, role, night_action)
+        message = self._system_messages.get(key)
+        if message is None:
+            game_context = self.prompt_manager.format_game_context(
+                player_id, role, night_action
             )
+            message = {"role": "system", "content": game_context}
+            self._system_messages[key] = message
 
-        if self.conversation_history:
-            for msg in self.conversation_history:
-                messages.append(
-                    {
-                        "role": "assistant",
-                        "content": f"{msg['player_id']}: {msg['content']}",
-                    }
-                )
+        return message
 
-        return messages
+    def _get_transcript_message(self) -> Optional[Dict[str, str]]:
+        """Get the discussion transcript message, rebuilt only after new statements.
+
+        Returns:
+            Optional[Dict[str, str]]: The transcript as a single assistant
+                message, or None if nobody has spoken yet.
+        """
+        if not self._transcript_lines:
+            return None
+
+        if self._transcript_length != len(self._transcript_lines):
+            # One transcript message instead of one message per statement
+            transcript = "\n".join(self._transcript_lines)
+            self._transcript_message = {"role": "assistant", "content": transcript}
+            self._transcript_length = len(self._transcript_lines)
+
+        return self._transcript_message
 
     async def generate_response(
         self, player, round_number: int, total_rounds: int, position: int
     ) -> str:
         """Generate a conversation response for the player.
 
+        The response is not added to the conversation history.
+
         Args:
             player: The player object generating the response.
             round_number (int): Current round number.
@@ -113,17 +194,15 @@ class ConversationManager:
         messages.append({"role": "user", "content": response_prompt})
 
         temperature = GAME_CONFIG["ai_temperature"]["conversation"]
-        response = self.llm_client.create_completion(
+        parts = []
+        async for delta in self.llm_client.stream_completion(
             messages=messages,
             temperature=temperature,
             trace_name=f"player{player.player_id}_round{round_number}",
-        )
-
-        response = self._clean_response(response, player.player_id)
+        ):
+            parts.append(delta)
 
-        self.add_to_history(player.player_id, response)
-
-        return response
+        return self._clean_response("".join(parts), player.player_id)
 
     async def generate_vote(self, player) -> str:
         """Generate a vote for the player.
@@ -140,21 +219,13 @@ class ConversationManager:
         messages.append({"role": "user", "content": vote_prompt})
 
         temperature = GAME_CONFIG["ai_temperature"]["voting"]
-        response = self.llm_client.create_completion(
+        response = await self.llm_client.create_completion(
             messages=messages,
             temperature=temperature,
             trace_name=f"vote_player{player.player_id}",
         )
 
-        vote = response.strip()
-        vote = vote.replace("'", "").replace('"', "").replace(".", "").strip()
-
-        if " " in vote:
-            for player_id in PLAYER_COLORS.keys():
-                if player_id in vote:
-                    return player_id
-
-        return vote
+        return self._parse_vote(response, PLAYER_COLORS)
 
     async def generate_tie_vote(
         self, player, tied_players: List[str], vote_results: str
@@ -178,19 +249,31 @@ class ConversationManager:
         messages.append({"role": "user", "content": tie_prompt})
 
         temperature = GAME_CONFIG["ai_temperature"]["voting"]
-        response = self.llm_client.create_completion(
+        response = await self.llm_client.create_completion(
             messages=messages,
             temperature=temperature,
             trace_name=f"tie_vote_{player.player_id}",
         )
 
-        vote = response.strip()
-        vote = vote.replace("'", "").replace('"', "").replace(".", "").strip()
+        return self._parse_vote(response, tied_players)
+
+    def _parse_vote(self, response: str, candidates) -> str:
+        """Extract the voted player ID from a vote response.
+
+        Args:
+            response (str): The raw vote response from the AI.
+            candidates: Player IDs that may be voted for.
+
+        Returns:
+            str: The first candidate mentioned if the response is a sentence,
+                otherwise the stripped response itself.
+        """
+        vote = response.strip().translate(_VOTE_STRIP_TABLE).strip()
 
         if " " in vote:
-            for player_id in tied_players:
-                if player_id in vote:
-                    return player_id
+            for match in _MENTION_PATTERN.finditer(vote):
+                if match.group(0) in candidates:
+                    return match.group(0)
 
         return vote
 
@@ -223,14 +306,7 @@ class ConversationManager:
         Returns:
             str: Text with colored player mentions.
         """
-
-        def colorize(match):
-            player_id = match.group(0)
-            color_code = PLAYER_COLORS.get(player_id, 37)
-            return f"\u001b[{color_code}m{player_id}\u001b[0m"
-
-        pattern = "|".join(re.escape(player_id) for player_id in PLAYER_COLORS.keys())
-        return re.sub(pattern, colorize, text)
+        return _MENTION_PATTERN.sub(_colorize_mention, text)
 
     def _clean_response(self, response: str, player_id: str) -> str:
         """Clean up the response by removing duplicate player IDs.
@@ -242,20 +318,7 @@ class ConversationManager:
         Returns:
             str: Cleaned response.
         """
-        patterns = [
-            f"{player_id}: {player_id}: ",
-            f"{player_id}: ",
-        ]
-
-        for pid in PLAYER_COLORS.keys():
-            patterns.append(f"{player_id}: {pid}: ")
-
-        for pattern in patterns:
-            if response.startswith(pattern):
-                response = response[len(pattern) :]
-                break
-
-        return response.strip()
+        return _clean_pattern(player_id).sub("", response, count=1).strip()
 
     def _get_role_change_reminder(self, assigned_role: str) -> str:
         """Get a role-specific reminder about potential role changes.
@@ -290,9 +353,12 @@ class ConversationManager:
     def clear_history(self):
         """Clear conversation history for a new game.
 
-        Resets conversation history and night actions, then saves
-        the cleared state to file.
+        Resets conversation history and night actions. The log file itself
+        is reset by the game when it initializes its logs.
         """
         self.conversation_history = []
-        self.night_actions = {}
-        self._save_conversation_history()
+        self.night_actions.clear()
+        self._system_messages = {}
+        self._transcript_lines = []
+        self._transcript_message = None
+        self._transcript_length = 0
@@ -1,22 +1,44 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from string import Template
+from typing import Dict, Optional
 
 from ..common.config import PROMPT_PATHS
 
 
+@lru_cache(maxsize=None)
+def read_prompt_file(path: Path) -> str:
+    """Read a prompt file once per process and return its contents.
+
+    Args:
+        path (Path): The file path to read from.
+
+    Returns:
+        str: The contents of the file, or empty string if file not found.
+    """
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        print(f"Warning: Prompt file not found: {path}")
+        return ""
+
+
 class PromptManager:
     """Manages loading and caching of game prompts."""
 
     def __init__(self):
         """Initialize the prompt manager and load all prompts into cache."""
         self._prompt_cache: Dict[str, str] = {}
+        self._templates: Dict[str, Template] = {}
         self._load_all_prompts()
+        self._compile_templates()
 
     def _load_all_prompts(self):
         """Load all prompts into cache on initialization.
 
         Loads game prompts and role-specific prompts from their respective
-        file paths into the internal cache for quick access.
+        file paths into the internal cache for quick access. File contents
+        are shared by all instances, so only the first game reads the disk.
         """
         # Load game prompts
         for prompt_name, prompt_path in PROMPT_PATHS.items():
@@ -24,25 +46,37 @@ class PromptManager:
                 # Handle role prompts separately
                 for role_name, role_path in prompt_path.items():
                     cache_key = f"role_{role_name}"
-                    self._prompt_cache[cache_key] = self._read_file(role_path)
+                    self._prompt_cache[cache_key] = read_prompt_file(role_path)
             else:
-                self._prompt_cache[prompt_name] = self._read_file(prompt_path)
-
-    def _read_file(self, path: Path) -> str:
-        """Read a file and return its contents.
+                self._prompt_cache[prompt_name] = read_prompt_file(prompt_path)
 
-        Args:
-            path (Path): The file path to read from.
+    def _compile_templates(self):
+        """Fold the static prompt texts into templates for the dynamic prompts.
 
-        Returns:
-            str: The contents of the file, or empty string if file not found.
+        Each call then only substitutes the per-player fields instead of
+        rebuilding the full prompt string.
         """
-        try:
-            with open(path, "r") as f:
-                return f.read()
-        except FileNotFoundError:
-            print(f"Warning: Prompt file not found: {path}")
-            return ""
+
+        def literal(prompt_name: str) -> str:
+            return self._prompt_cache.get(prompt_name, "").replace("$", "$$")
+
+        self._templates["response_rule"] = Template(
+            f"$player_id, {literal('response_rule')}\n"
+            "Please note you are now in position $count "
+            "in discussion round $round_number of $total_rounds total rounds. "
+            "Please adjust your strategy accordingly."
+        )
+        self._templates["vote_rule_tie"] = Template(
+            "The last round of voting results are: $vote_results\n"
+            "These players are tied: [$tied_players]\n"
+            f"{literal('vote_rule_tie')}"
+        )
+        # Player-specific text goes last so the rules prefix is identical
+        # across players and can be served from provider prompt caches.
+        self._templates["game_context"] = Template(
+            f"{literal('game_rule')}\n\n$role_prompt$night_action"
+            "\n\nYou are $player_id in this game."
+        )
 
     def get_game_prompt(self) -> str:
         """Get the main game rules prompt.
@@ -77,12 +111,11 @@ class PromptManager:
         Returns:
             str: The formatted response prompt with context information.
         """
-        base_prompt = self._prompt_cache.get("response_rule", "")
-        return (
-            f"{player_id}, {base_prompt}\n"
-            f"Please note you are now in position {count} "
-            f"in discussion round {round_number} of {total_rounds} total rounds. "
-            f"Please adjust your strategy accordingly."
+        return self._templates["response_rule"].substitute(
+            player_id=player_id,
+            count=count,
+            round_number=round_number,
+            total_rounds=total_rounds,
         )
 
     def get_vote_prompt(self) -> str:
@@ -103,21 +136,44 @@ class PromptManager:
         Returns:
             str: The formatted tie-breaking vote prompt.
         """
-        base_prompt = self._prompt_cache.get("vote_rule_tie", "")
-        return (
-            f"The last round of voting results are: {vote_results}\n"
-            f"These players are tied: [{tied_players}]\n"
-            f"{base_prompt}"
+        return self._templates["vote_rule_tie"].substitute(
+            vote_results=vote_results, tied_players=tied_players
         )
 
-    def format_game_context(self, player_id: str) -> str:
-        """Format the game context with player information.
+    def format_game_context(
+        self, player_id: str, role: str, night_action: str = ""
+    ) -> str:
+        """Format the game context with role and player information.
 
         Args:
             player_id (str): The ID of the player.
+            role (str): The player's assigned role.
+            night_action (str, optional): The player's night action.
+                Defaults to "".
 
         Returns:
-            str: The formatted game context including player identification.
+            str: The formatted game context: game rules, role prompt, night
+                action and player identification.
         """
-        game_prompt = self.get_game_prompt()
-        return f"{game_prompt}\n\nYou are {player_id} in this game."
+        return self._templates["game_context"].substitute(
+            role_prompt=self.get_role_prompt(role),
+            night_action=(
+                f"\n\nYour night action: {night_action}" if night_action else ""
+            ),
+            player_id=player_id,
+        )
+
+
+_prompt_manager: Optional[PromptManager] = None
+
+
+def get_prompt_manager() -> PromptManager:
+    """Get the process-wide prompt manager, creating it on first use.
+
+    Returns:
+        PromptManager: The shared prompt manager.
+    """
+    global _prompt_manager
+    if _prompt_manager is None:
+        _prompt_manager = PromptManager()
+    return _prompt_manager
@@ -1,8 +1,5 @@
-import json
 from abc import ABC, abstractmethod
 
-from ..common.config import LOG_PATHS
-
 
 class Player(ABC):
     """Base class for all players in One Night Ultimate Werewolf.
@@ -12,6 +9,8 @@ class Player(ABC):
     participation, and voting.
     """
 
+    __slots__ = ("player_id", "game", "assigned_role", "current_role")
+
     def __init__(self, player_id: str, game):
         """Initialize a new player.
 
@@ -34,40 +33,44 @@ class Player(ABC):
         pass
 
     def record_night_action(self, action: str):
-        """Record the night action to the log.
+        """Record the night action on the game.
+
+        The game writes all recorded actions to the log once the night
+        phase is over.
 
         Args:
             action (str): Description of the night action performed.
         """
-        # Load existing actions
-        try:
-            with open(LOG_PATHS["night_actions"], "r") as f:
-                night_actions = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            night_actions = {}
-
-        # Add this player's action
-        night_actions[self.player_id] = action
-
-        # Save back to file
-        with open(LOG_PATHS["night_actions"], "w") as f:
-            json.dump(night_actions, f, indent=2)
+        self.game.night_actions[self.player_id] = action
 
     async def participate_in_conversation(
         self, conversation_manager, round_number: int, total_rounds: int, position: int
-    ):
-        """Participate in day phase conversation.
+    ) -> str:
+        """Generate a statement for the day phase conversation.
+
+        The statement is not added to the conversation history; the caller
+        records and posts it once it is this player's turn.
 
         Args:
             conversation_manager: The conversation manager instance.
             round_number (int): Current round number.
             total_rounds (int): Total number of rounds.
             position (int): Player's position in the current round.
+
+        Returns:
+            str: The player's statement.
         """
-        response = await conversation_manager.generate_response(
+        return await conversation_manager.generate_response(
             self, round_number, total_rounds, position
         )
 
+    async def post_statement(self, conversation_manager, response: str):
+        """Post a statement to the Discord channel.
+
+        Args:
+            conversation_manager: The conversation manager instance.
+            response (str): The statement generated for this player.
+        """
         _, formatted_message = conversation_manager.format_discord_message(
             self.player_id, response
         )
@@ -6,6 +6,8 @@ from .base import Player
 class Werewolf(Player):
     """Werewolf role implementation."""
 
+    __slots__ = ()
+
     def __init__(self, player_id: str, game):
         super().__init__(player_id, game)
         self.assigned_role = "Werewolf"
@@ -18,7 +20,9 @@ class Werewolf(Player):
             str: Action description of what the werewolf saw.
         """
         other_werewolves = [
-            p for p in self.game.players if p.assigned_role == "Werewolf" and p != self
+            p
+            for p in self.game.get_other_players(self)
+            if p.assigned_role == "Werewolf"
         ]
 
         if other_werewolves:
@@ -37,6 +41,8 @@ class Werewolf(Player):
 class Seer(Player):
     """Seer role implementation."""
 
+    __slots__ = ()
+
     def __init__(self, player_id: str, game):
         super().__init__(player_id, game)
         self.assigned_role = "Seer"
@@ -49,7 +55,7 @@ class Seer(Player):
             str: Action description of what the seer saw.
         """
         if random.random() < 0.5:
-            other_players = [p for p in self.game.players if p != self]
+            other_players = self.game.get_other_players(self)
             target = random.choice(other_players)
             action = f"I have seen that player {target.player_id} is a {target.assigned_role}."
         else:
@@ -63,6 +69,8 @@ class Seer(Player):
 class Robber(Player):
     """Robber role implementation."""
 
+    __slots__ = ()
+
     def __init__(self, player_id: str, game):
         super().__init__(player_id, game)
         self.assigned_role = "Robber"
@@ -75,7 +83,7 @@ class Robber(Player):
             str: Action description of what the robber did.
         """
         if random.random() < 0.8:
-            other_players = [p for p in self.game.players if p != self]
+            other_players = self.game.get_other_players(self)
             target = random.choice(other_players)
 
             stolen_role = target.current_role
@@ -93,6 +101,8 @@ class Robber(Player):
 class Troublemaker(Player):
     """Troublemaker role implementation."""
 
+    __slots__ = ()
+
     def __init__(self, player_id: str, game):
         super().__init__(player_id, game)
         self.assigned_role = "Troublemaker"
@@ -105,7 +115,7 @@ class Troublemaker(Player):
             str: Action description of what the troublemaker did.
         """
         if random.random() < 0.5:
-            other_players = [p for p in self.game.players if p != self]
+            other_players = self.game.get_other_players(self)
             if len(other_players) >= 2:
                 targets = random.sample(other_players, 2)
 
@@ -130,6 +140,8 @@ class Troublemaker(Player):
 class Villager(Player):
     """Villager role implementation."""
 
+    __slots__ = ()
+
     def __init__(self, player_id: str, game):
         super().__init__(player_id, game)
         self.assigned_role = "Villager"
@@ -146,6 +158,15 @@ class Villager(Player):
         return action
 
 
+ROLE_CLASSES = {
+    "Werewolf": Werewolf,
+    "Seer": Seer,
+    "Robber": Robber,
+    "Troublemaker": Troublemaker,
+    "Villager": Villager,
+}
+
+
 def create_player(role: str, player_id: str, game) -> Player:
     """Create a player with the specified role.
 
@@ -160,16 +181,9 @@ def create_player(role: str, player_id: str, game) -> Player:
     Raises:
         ValueError: If the role is unknown.
     """
-    role_classes = {
-        "Werewolf": Werewolf,
-        "Seer": Seer,
-        "Robber": Robber,
-        "Troublemaker": Troublemaker,
-        "Villager": Villager,
-    }
-
-    role_class = role_classes.get(role)
-    if not role_class:
-        raise ValueError(f"Unknown role: {role}")
+    try:
+        role_class = ROLE_CLASSES[role]
+    except KeyError:
+        raise ValueError(f"Unknown role: {role}") from None
 
     return role_class(player_id, game)